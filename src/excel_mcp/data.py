@@ -1,13 +1,19 @@
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import logging
+import re
+import threading
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.read_only import EMPTY_CELL
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import range_boundaries
 
 from .exceptions import DataError
-from .cell_utils import parse_cell_range
+from .cell_utils import parse_cell_reference
 from .cell_validation import get_data_validation_for_cell
 
 try:
@@ -16,18 +22,120 @@ except ImportError:  # pragma: no cover - optional dependency
     ModelCompiler = None  # type: ignore[assignment]
     Evaluator = None  # type: ignore[assignment]
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Validation entry shared by every cell without a rule; treat it as read-only
+_NO_VALIDATION: Dict[str, Any] = {"has_validation": False}
+
+# Number of rows read when a preview of a range is requested
+PREVIEW_ROWS = 50
+
+# Formulas whose result depends on the hosting cell or changes per evaluation
+_HOST_DEPENDENT_FORMULA_RE = re.compile(
+    r"\b(?:ROW\s*\(\s*\)|COLUMN\s*\(\s*\)|RAND\s*\(|RANDBETWEEN\s*\()",
+    re.IGNORECASE,
+)
+
+# Parsed read-only workbooks keyed by (path, read_only, data_only), most recently used last.
+# Each entry also stores the (mtime_ns, size) of the file it was parsed from. Dropped
+# entries are never closed: another call may still be reading them, and since they
+# are parsed from in-memory bytes they hold no file handle for garbage collection to leak.
+_WORKBOOK_CACHE_SIZE = 4
+_WB_CACHE: "OrderedDict[Tuple[str, bool, bool], Tuple[Tuple[int, int], Workbook]]" = OrderedDict()
+_WB_CACHE_LOCK = threading.Lock()
+
+def _get_workbook(
+    filepath: Path | str,
+    read_only: bool = True,
+    data_only: bool = False,
+) -> Workbook:
+    """Load a workbook, reusing the cached copy while the file is unchanged.
+
+    Only read-only workbooks are cached: editable workbooks create cells as
+    they are read and would leak that state into later calls. Callers must
+    not close the returned workbook.
+    """
+    if not read_only:
+        return load_workbook(filepath, read_only=False, data_only=data_only)
+
+    resolved_path = Path(filepath).resolve(strict=False)
+    stat = resolved_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (str(resolved_path), read_only, data_only)
+
+    with _WB_CACHE_LOCK:
+        cached = _WB_CACHE.get(key)
+        if cached is not None:
+            if cached[0] == signature:
+                _WB_CACHE.move_to_end(key)
+                return cached[1]
+            del _WB_CACHE[key]
+
+    # Parse from memory so the cache never holds the file open for writers
+    wb = load_workbook(
+        BytesIO(resolved_path.read_bytes()),
+        read_only=read_only,
+        data_only=data_only,
+    )
+
+    with _WB_CACHE_LOCK:
+        cached = _WB_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            # A concurrent call loaded the same file version first; share its copy
+            _WB_CACHE.move_to_end(key)
+            return cached[1]
+        _WB_CACHE[key] = (signature, wb)
+        _WB_CACHE.move_to_end(key)
+        while len(_WB_CACHE) > _WORKBOOK_CACHE_SIZE:
+            _WB_CACHE.popitem(last=False)
+    return wb
+
+def _invalidate_workbook_cache(filepath: Path | str) -> None:
+    """Drop every cached workbook parsed from the given file."""
+    resolved = str(Path(filepath).resolve(strict=False))
+    with _WB_CACHE_LOCK:
+        for key in [key for key in _WB_CACHE if key[0] == resolved]:
+            del _WB_CACHE[key]
+
+# Compiled xlcalculator models keyed by (path, mtime_ns, size), evicted oldest first
+_EVALUATOR_CACHE_SIZE = 4
+_EVAL_CACHE: Dict[Tuple[str, int, int], Evaluator] = {}
+_EVAL_CACHE_LOCK = threading.Lock()
+
 def _build_formula_evaluator(filepath: Path | str) -> Optional[Evaluator]:
-    """Create an xlcalculator evaluator for the supplied workbook."""
+    """Create an xlcalculator evaluator for the supplied workbook.
+
+    Evaluators are reused while the file's modification time and size are
+    unchanged, so repeated reads of one workbook compile it only once.
+    """
     if ModelCompiler is None or Evaluator is None:
         logger.debug("xlcalculator not installed; formula evaluation disabled")
         return None
     resolved_path = Path(filepath).resolve(strict=False)
     try:
+        stat = resolved_path.stat()
+        key = (str(resolved_path), stat.st_mtime_ns, stat.st_size)
+        with _EVAL_CACHE_LOCK:
+            evaluator = _EVAL_CACHE.get(key)
+        if evaluator is not None:
+            return evaluator
+
         compiler = ModelCompiler()
         model = compiler.read_and_parse_archive(str(resolved_path))
-        return Evaluator(model)
+        evaluator = Evaluator(model)
+        with _EVAL_CACHE_LOCK:
+            # Models compiled from older versions of this file can never match again
+            for stale_key in [k for k in _EVAL_CACHE if k[0] == key[0]]:
+                del _EVAL_CACHE[stale_key]
+            _EVAL_CACHE[key] = evaluator
+            while len(_EVAL_CACHE) > _EVALUATOR_CACHE_SIZE:
+                _EVAL_CACHE.pop(next(iter(_EVAL_CACHE)))
+        return evaluator
     except Exception as exc:  # pragma: no cover - defensive
         logger.warning(
             "Failed to initialize xlcalculator evaluator for '%s': %s",
@@ -38,33 +146,42 @@ def _build_formula_evaluator(filepath: Path | str) -> Optional[Evaluator]:
 
 def _evaluate_formula_cell(
     evaluator: Optional[Evaluator],
-    sheet_name: str,
+    sheet_prefix: str,
+    quoted_prefix: str,
     cell_address: str,
     row: int,
     column: int,
     fallback_loader: Optional[Callable[[int, int], Any]],
     default_value: Any,
+    result_cache: Optional[Dict[str, Any]] = None,
+    cache_key: Optional[str] = None,
 ) -> Any:
-    """Evaluate a single formula cell and fall back to provided loader on failure."""
+    """Evaluate a single formula cell and fall back to provided loader on failure.
+
+    ``sheet_prefix`` and ``quoted_prefix`` are the plain and quoted ``Sheet!``
+    prefixes of the cell's sheet, built once per range by the caller. When
+    ``result_cache`` and ``cache_key`` are given, values computed by the
+    evaluator are stored under the key and returned directly on later calls.
+    """
     computed_value: Any = None
+    if result_cache is not None and cache_key is not None and cache_key in result_cache:
+        return result_cache[cache_key]
     if evaluator is not None:
-        normalized_sheet = sheet_name.replace("'", "''")
-        tokens = [
-            f"{sheet_name}!{cell_address}",
-            f"'{normalized_sheet}'!{cell_address}",
-        ]
+        tokens = (sheet_prefix + cell_address, quoted_prefix + cell_address)
         for token in tokens:
             try:
                 computed_value = evaluator.evaluate(token)
                 if computed_value is not None:
+                    if result_cache is not None and cache_key is not None:
+                        result_cache[cache_key] = computed_value
                     return computed_value
             except KeyError:
                 # Try the next token variation
                 continue
             except Exception as exc:  # pragma: no cover - library error handling
                 logger.warning(
-                    "Failed to evaluate formula in %s!%s via xlcalculator (%s): %s",
-                    sheet_name,
+                    "Failed to evaluate formula in %s%s via xlcalculator (%s): %s",
+                    sheet_prefix,
                     cell_address,
                     token,
                     exc,
@@ -76,9 +193,138 @@ def _evaluate_formula_cell(
             if cached_value is not None:
                 return cached_value
         except Exception as exc:  # pragma: no cover - defensive fallback
-            logger.debug("Formula fallback loader failed for %s!%s: %s", sheet_name, cell_address, exc)
+            logger.debug("Formula fallback loader failed for %s%s: %s", sheet_prefix, cell_address, exc)
     return default_value
 
+def _iter_range_rows(
+    ws: Any,
+    min_row: int,
+    max_row: int,
+    min_col: int,
+    max_col: int,
+    values_only: bool = False,
+) -> Iterator[Tuple[Any, ...]]:
+    """Yield one tuple of cells (or values) for every row in the range.
+
+    Read-only worksheets stop at the last row stored in the file, so any
+    trailing rows of the requested range are padded with empty cells.
+    """
+    rows_seen = 0
+    for row_cells in ws.iter_rows(
+        min_row=min_row,
+        max_row=max_row,
+        min_col=min_col,
+        max_col=max_col,
+        values_only=values_only,
+    ):
+        rows_seen += 1
+        yield row_cells
+    empty_row = (None if values_only else EMPTY_CELL,) * (max_col - min_col + 1)
+    for _ in range(max_row - min_row + 1 - rows_seen):
+        yield empty_row
+
+def _read_cached_values(
+    filepath: Path | str,
+    sheet_name: str,
+    min_row: int,
+    max_row: int,
+    min_col: int,
+    max_col: int,
+) -> List[Tuple[Any, ...]]:
+    """Read the values Excel last calculated for a range, one tuple per row.
+
+    Returns an empty list when the cached values cannot be loaded.
+    """
+    try:
+        wb_values = _get_workbook(filepath, read_only=True, data_only=True)
+    except Exception as exc:  # pragma: no cover - IO issues
+        logger.warning(
+            "Unable to open workbook in data_only mode for fallback: %s",
+            exc,
+        )
+        return []
+    if sheet_name not in wb_values.sheetnames:
+        logger.warning(
+            "Sheet '%s' not found in data_only workbook during fallback",
+            sheet_name,
+        )
+        return []
+    ws_values = wb_values[sheet_name]
+    return list(
+        _iter_range_rows(ws_values, min_row, max_row, min_col, max_col, values_only=True)
+    )
+
+def _columnar_cells(size: int, include_validation: bool) -> Dict[str, List[Any]]:
+    """Create the pre-sized parallel lists of a columnar cell payload."""
+    columns: Dict[str, List[Any]] = {
+        "addresses": [None] * size,
+        "values": [None] * size,
+        "rows": [None] * size,
+        "columns": [None] * size,
+    }
+    if include_validation:
+        columns["validation"] = [None] * size
+    return columns
+
+def _as_float(value: Any) -> float:
+    """Convert a numeric cell value to float, mapping empty cells to NaN."""
+    if value is None:
+        return float("nan")
+    if isinstance(value, (bool, str)):
+        raise TypeError(f"Non-numeric value: {value!r}")
+    return float(value)
+
+def _numeric_ndarray(values: List[Any], shape: Tuple[int, int]) -> Optional["np.ndarray"]:
+    """Pack row-major cell values into a float64 array, or None if any value is not numeric."""
+    if np is None:
+        logger.warning("numpy not installed; cannot return range as ndarray")
+        return None
+    try:
+        array = np.fromiter(
+            (_as_float(value) for value in values),
+            dtype=np.float64,
+            count=len(values),
+        )
+    except (TypeError, ValueError):
+        return None
+    return array.reshape(shape)
+
+def _sheet_bounds(ws: Any) -> Tuple[int, int, int, int]:
+    """Return (min_row, min_col, max_row, max_col) of the sheet's used area.
+
+    The bounds come from a single calculate_dimension() call. Read-only sheets
+    answer it from the stored <dimension> element and are only scanned when
+    that element is missing. An empty sheet is reported as A1:A1, like openpyxl does.
+    """
+    try:
+        dimension = ws.calculate_dimension()
+    except ValueError:
+        # Read-only sheet saved without a <dimension> element
+        return _scan_bounds(ws)
+    min_col, min_row, max_col, max_row = range_boundaries(dimension)
+    return min_row, min_col, max_row, max_col
+
+def _scan_bounds(ws: Any) -> Tuple[int, int, int, int]:
+    """Find the used area of a read-only sheet by scanning its cell values.
+
+    calculate_dimension(force=True) only sizes max_row/max_column and leaves the
+    origin at A1, so the minimum row and column are taken from the first
+    non-empty row and cell here. A sheet without values is bounded by A1:A1.
+    """
+    min_row = min_col = max_row = max_col = None
+    for row_idx, row_values in enumerate(ws.iter_rows(values_only=True), start=1):
+        used_cols = [col for col, value in enumerate(row_values, start=1) if value is not None]
+        if not used_cols:
+            continue
+        if min_row is None:
+            min_row = row_idx
+        max_row = row_idx
+        min_col = used_cols[0] if min_col is None else min(min_col, used_cols[0])
+        max_col = used_cols[-1] if max_col is None else max(max_col, used_cols[-1])
+    if min_row is None:
+        return 1, 1, 1, 1
+    return min_row, min_col, max_row, max_col
+
 def read_excel_range(
     filepath: Path | str,
     sheet_name: str,
@@ -86,14 +332,19 @@ def read_excel_range(
     end_cell: Optional[str] = None,
     preview_only: bool = False
 ) -> List[Dict[str, Any]]:
-    """Read data from Excel range with optional preview mode"""
+    """Read data from Excel range with optional preview mode
+
+    With ``preview_only`` only the first ``PREVIEW_ROWS`` rows of the range are read.
+    """
     try:
-        wb = load_workbook(filepath, read_only=False)
+        # Values are only read, so stream the sheet instead of building the full object model
+        wb = _get_workbook(filepath, read_only=True)
         
         if sheet_name not in wb.sheetnames:
             raise DataError(f"Sheet '{sheet_name}' not found")
             
         ws = wb[sheet_name]
+        min_row, min_col, max_row, max_col = _sheet_bounds(ws)
 
         # Parse start cell
         if ':' in start_cell:
@@ -101,53 +352,54 @@ def read_excel_range(
             
         # Get start coordinates
         try:
-            start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
-            if not start_coords or not all(coord is not None for coord in start_coords[:2]):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
+            start_row, start_col = parse_cell_reference(start_cell)
         except ValueError as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
         # Determine end coordinates
         if end_cell:
             try:
-                end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
-                if not end_coords or not all(coord is not None for coord in end_coords[:2]):
-                    raise DataError(f"Invalid end cell reference: {end_cell}")
-                end_row, end_col = end_coords[0], end_coords[1]
+                end_row, end_col = parse_cell_reference(end_cell)
             except ValueError as e:
                 raise DataError(f"Invalid end cell format: {str(e)}")
         else:
             # If no end_cell, use the full data range of the sheet
-            if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
+            if max_row == 1 and max_col == 1 and ws.cell(1, 1).value is None:
                 # Handle empty sheet
                 end_row, end_col = start_row, start_col
             else:
                 # Use the sheet's own boundaries
-                start_row, start_col = ws.min_row, ws.min_column
-                end_row, end_col = ws.max_row, ws.max_column
+                start_row, start_col = min_row, min_col
+                end_row, end_col = max_row, max_col
 
         # Validate range bounds
-        if start_row > ws.max_row or start_col > ws.max_column:
+        if start_row > max_row or start_col > max_col:
             # This case can happen if start_cell is outside the used area on a sheet with data
             # or on a completely empty sheet.
             logger.warning(
                 f"Start cell {start_cell} is outside the sheet's data boundary "
-                f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
+                f"({get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}). "
                 f"No data will be read."
             )
             return []
 
+        if preview_only and end_row - start_row + 1 > PREVIEW_ROWS:
+            logger.info(f"Previewing first {PREVIEW_ROWS} rows of {sheet_name}")
+            end_row = start_row + PREVIEW_ROWS - 1
+
         data = []
-        for row in range(start_row, end_row + 1):
-            row_data = []
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                row_data.append(cell.value)
-            if any(v is not None for v in row_data):
-                data.append(row_data)
+        for row_values in ws.iter_rows(
+            min_row=start_row,
+            max_row=end_row,
+            min_col=start_col,
+            max_col=end_col,
+            values_only=True,
+        ):
+            # any() settles typical rows in C; the generator only runs for rows
+            # whose values are all falsy (None, 0, "", False)
+            if any(row_values) or any(v is not None for v in row_values):
+                data.append(list(row_values))
 
-        wb.close()
         return data
     except DataError as e:
         logger.error(str(e))
@@ -170,7 +422,7 @@ def write_data(
         if not data:
             raise DataError("No data provided to write")
             
-        wb = load_workbook(filepath)
+        wb = _get_workbook(filepath, read_only=False)
 
         # If no sheet specified, use active sheet
         if not sheet_name:
@@ -183,19 +435,23 @@ def write_data(
 
         ws = wb[sheet_name]
 
-        # Validate start cell
+        # Validate start cell; a range is accepted and written from its first cell
         try:
-            start_coords = parse_cell_range(start_cell)
-            if not start_coords or not all(coord is not None for coord in start_coords[:2]):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
+            start_row, start_col = parse_cell_reference(start_cell.split(':')[0])
         except ValueError as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
-        if len(data) > 0:
-            _write_data_to_worksheet(ws, data, start_cell)
+        if (start_row, start_col) == (1, 1) and not ws._cells:
+            # Empty sheet written from A1: append whole rows instead of
+            # looking up every cell individually
+            for row in data:
+                ws.append(list(row))
+        elif len(data) > 0:
+            _write_data_to_worksheet(ws, data, start_row, start_col)
 
         wb.save(filepath)
         wb.close()
+        _invalidate_workbook_cache(filepath)
 
         return {"message": f"Data written to {sheet_name}", "active_sheet": sheet_name}
     except DataError as e:
@@ -208,21 +464,14 @@ def write_data(
 def _write_data_to_worksheet(
     worksheet: Worksheet, 
     data: List[List], 
-    start_cell: str = "A1",
+    start_row: int = 1,
+    start_col: int = 1,
 ) -> None:
     """Write data to worksheet with intelligent header handling"""
     try:
         if not data:
             raise DataError("No data provided to write")
 
-        try:
-            start_coords = parse_cell_range(start_cell)
-            if not start_coords or not all(x is not None for x in start_coords[:2]):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
-        except ValueError as e:
-            raise DataError(f"Invalid start cell format: {str(e)}")
-
         # Write data
         for i, row in enumerate(data):
             for j, val in enumerate(row):
@@ -240,7 +489,10 @@ def read_excel_range_with_metadata(
     start_cell: str = "A1",
     end_cell: Optional[str] = None,
     include_validation: bool = True,
-    evaluate_formulas: bool = False
+    evaluate_formulas: bool = False,
+    columnar: bool = False,
+    as_numpy: bool = False,
+    preview_only: bool = False
 ) -> Dict[str, Any]:
     """Read data from Excel range with cell metadata including validation rules.
     
@@ -252,49 +504,54 @@ def read_excel_range_with_metadata(
         include_validation: Whether to include validation metadata
         evaluate_formulas: If True, evaluate formulas via xlcalculator (falls back to
                            cached values when available).
+        columnar: If True, return the cells under "cells_columnar" as parallel
+                  "addresses", "values", "rows", "columns" (and "validation")
+                  lists instead of one dictionary per cell under "cells".
+        as_numpy: If True, also return the values as a float64 numpy array shaped
+                  like the range under "ndarray", with empty cells as NaN. The entry
+                  is None when a value is not numeric or numpy is not installed.
+        preview_only: If True, read only the first PREVIEW_ROWS rows of the range
+                      and set "truncated" when rows were left out.
         
     Returns:
         Dictionary containing structured cell data with metadata
     """
+    cells_key = "cells_columnar" if columnar else "cells"
     try:
         file_path = Path(filepath).resolve(strict=False)
-        wb = load_workbook(file_path, read_only=False)
+        # Data validation rules are only parsed for fully loaded workbooks
+        wb = _get_workbook(file_path, read_only=not include_validation)
         formula_evaluator: Optional[Evaluator] = None
-        wb_values = None
-        ws_values = None
+        formula_evaluator_built = False
+        # Results keyed by formula text: within one sheet, identical formula text
+        # references identical cells, so it evaluates to the same value
+        formula_result_cache: Dict[str, Any] = {}
+        # xlcalculator may key cells by either form of the sheet reference
+        sheet_prefix = f"{sheet_name}!"
+        quoted_prefix = "'" + sheet_name.replace("'", "''") + "'!"
+        cached_grid: Optional[List[Tuple[Any, ...]]] = None
         fallback_loader: Optional[Callable[[int, int], Any]] = None
-        fallback_loader_failed = False
 
         if evaluate_formulas:
-            formula_evaluator = _build_formula_evaluator(file_path)
+
+            def _get_formula_evaluator() -> Optional[Evaluator]:
+                nonlocal formula_evaluator, formula_evaluator_built
+                if not formula_evaluator_built:
+                    # Compiled on the first formula cell, so ranges of constants skip xlcalculator
+                    formula_evaluator = _build_formula_evaluator(file_path)
+                    formula_evaluator_built = True
+                return formula_evaluator
 
             def _get_cached_value(row: int, col: int) -> Any:
-                nonlocal wb_values, ws_values, fallback_loader_failed
-                if fallback_loader_failed:
-                    return None
-                if wb_values is None:
-                    try:
-                        wb_values = load_workbook(file_path, read_only=False, data_only=True)
-                    except Exception as exc:  # pragma: no cover - IO issues
-                        logger.warning(
-                            "Unable to open workbook in data_only mode for fallback: %s",
-                            exc,
-                        )
-                        fallback_loader_failed = True
-                        return None
-                    if sheet_name not in wb_values.sheetnames:
-                        logger.warning(
-                            "Sheet '%s' not found in data_only workbook during fallback",
-                            sheet_name,
-                        )
-                        wb_values.close()
-                        wb_values = None
-                        fallback_loader_failed = True
-                        return None
-                    ws_values = wb_values[sheet_name]
-                if ws_values is None:
+                nonlocal cached_grid
+                if cached_grid is None:
+                    # Fetched on first use, so ranges without formulas never read it
+                    cached_grid = _read_cached_values(
+                        file_path, sheet_name, start_row, end_row, start_col, end_col
+                    )
+                if not cached_grid:
                     return None
-                return ws_values.cell(row=row, column=col).value
+                return cached_grid[row - start_row][col - start_col]
 
             fallback_loader = _get_cached_value
 
@@ -309,104 +566,168 @@ def read_excel_range_with_metadata(
             
         # Get start coordinates
         try:
-            start_coords = parse_cell_range(f"{start_cell}:{start_cell}")
-            if not start_coords or not all(coord is not None for coord in start_coords[:2]):
-                raise DataError(f"Invalid start cell reference: {start_cell}")
-            start_row, start_col = start_coords[0], start_coords[1]
+            start_row, start_col = parse_cell_reference(start_cell)
         except ValueError as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
+        min_row, min_col, max_row, max_col = _sheet_bounds(ws)
+
         # Determine end coordinates
         if end_cell:
             try:
-                end_coords = parse_cell_range(f"{end_cell}:{end_cell}")
-                if not end_coords or not all(coord is not None for coord in end_coords[:2]):
-                    raise DataError(f"Invalid end cell reference: {end_cell}")
-                end_row, end_col = end_coords[0], end_coords[1]
+                end_row, end_col = parse_cell_reference(end_cell)
             except ValueError as e:
                 raise DataError(f"Invalid end cell format: {str(e)}")
         else:
             # If no end_cell, use the full data range of the sheet
-            if ws.max_row == 1 and ws.max_column == 1 and ws.cell(1, 1).value is None:
+            if max_row == 1 and max_col == 1 and ws.cell(1, 1).value is None:
                 # Handle empty sheet
                 end_row, end_col = start_row, start_col
             else:
                 # Use the sheet's own boundaries, but respect the provided start_cell
-                end_row, end_col = ws.max_row, ws.max_column
+                end_row, end_col = max_row, max_col
                 # If start_cell is 'A1' (default), we should find the true start
                 if start_cell == 'A1':
-                    start_row, start_col = ws.min_row, ws.min_column
+                    start_row, start_col = min_row, min_col
 
         # Validate range bounds
-        if start_row > ws.max_row or start_col > ws.max_column:
+        if start_row > max_row or start_col > max_col:
             # This case can happen if start_cell is outside the used area on a sheet with data
             # or on a completely empty sheet.
             logger.warning(
                 f"Start cell {start_cell} is outside the sheet's data boundary "
-                f"({get_column_letter(ws.min_column)}{ws.min_row}:{get_column_letter(ws.max_column)}{ws.max_row}). "
+                f"({get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}). "
                 f"No data will be read."
             )
-            return {"range": f"{start_cell}:", "sheet_name": sheet_name, "cells": []}
+            empty_result = {
+                "range": f"{start_cell}:",
+                "sheet_name": sheet_name,
+                cells_key: _columnar_cells(0, include_validation) if columnar else [],
+            }
+            if as_numpy:
+                empty_result["ndarray"] = _numeric_ndarray([], (0, 0))
+            return empty_result
+
+        truncated = preview_only and end_row - start_row + 1 > PREVIEW_ROWS
+        if truncated:
+            end_row = start_row + PREVIEW_ROWS - 1
 
         # Build structured cell data
         range_str = f"{get_column_letter(start_col)}{start_row}:{get_column_letter(end_col)}{end_row}"
+        # Column letters are shared by every row of the range
+        col_letters = [get_column_letter(col) for col in range(start_col, end_col + 1)]
         range_data = {
             "range": range_str,
             "sheet_name": sheet_name,
-            "cells": []
+            cells_key: [],
         }
+        if truncated:
+            range_data["truncated"] = True
+        if columnar:
+            # Parallel lists are sized up front and filled by position
+            columns = _columnar_cells(
+                max(end_row - start_row + 1, 0) * len(col_letters), include_validation
+            )
+            range_data[cells_key] = columns
+            addresses = columns["addresses"]
+            values = columns["values"]
+            rows = columns["rows"]
+            cols = columns["columns"]
+            validations = columns.get("validation")
+            idx = 0
         
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                cell_address = f"{get_column_letter(col)}{row}"
+        for row, row_cells in enumerate(
+            _iter_range_rows(ws, start_row, end_row, start_col, end_col),
+            start=start_row,
+        ):
+            for col, col_letter, cell in zip(range(start_col, end_col + 1), col_letters, row_cells):
+                cell_address = f"{col_letter}{row}"
 
                 value = cell.value
-                formula_text: Optional[str] = None
-
-                if cell.data_type == "f":
-                    # openpyxl retains the formula string in cell.value for formula cells
-                    if isinstance(cell.value, str):
-                        formula_text = cell.value
-                elif isinstance(cell.value, str) and cell.value.startswith("="):
-                    # Defensive: some workbooks may expose formula as plain string even if data_type isn't 'f'
-                    formula_text = cell.value
-
-                if evaluate_formulas and formula_text is not None:
-                    value = _evaluate_formula_cell(
-                        evaluator=formula_evaluator,
-                        sheet_name=sheet_name,
-                        cell_address=cell_address,
-                        row=row,
-                        column=col,
-                        fallback_loader=fallback_loader,
-                        default_value=formula_text,
-                    )
-                elif evaluate_formulas and formula_evaluator is None and fallback_loader is not None:
-                    fallback_value = fallback_loader(row, col)
-                    if fallback_value is not None:
-                        value = fallback_value
-
-                cell_data = {
-                    "address": cell_address,
-                    "value": value,
-                    "row": row,
-                    "column": col
-                }
-                
-                # Add validation metadata if requested
+
+                # Formula text only matters when formulas are evaluated, so plain
+                # reads skip the per-cell type checks entirely
+                if evaluate_formulas:
+                    formula_text: Optional[str] = None
+                    if cell.data_type == "f":
+                        # openpyxl retains the formula string in cell.value for formula cells
+                        if isinstance(value, str):
+                            formula_text = value
+                    elif isinstance(value, str) and value.startswith("="):
+                        # Defensive: some workbooks may expose formula as plain string even if data_type isn't 'f'
+                        formula_text = value
+
+                    if formula_text is not None:
+                        value = _evaluate_formula_cell(
+                            evaluator=_get_formula_evaluator(),
+                            sheet_prefix=sheet_prefix,
+                            quoted_prefix=quoted_prefix,
+                            cell_address=cell_address,
+                            row=row,
+                            column=col,
+                            fallback_loader=fallback_loader,
+                            default_value=formula_text,
+                            result_cache=formula_result_cache,
+                            cache_key=(
+                                None
+                                if _HOST_DEPENDENT_FORMULA_RE.search(formula_text)
+                                else formula_text
+                            ),
+                        )
+                    elif (
+                        cell.data_type == "f"
+                        and _get_formula_evaluator() is None
+                        and fallback_loader is not None
+                    ):
+                        # Formula cells without formula text (e.g. array formulas);
+                        # other cells hold the same value in the data_only view
+                        fallback_value = fallback_loader(row, col)
+                        if fallback_value is not None:
+                            value = fallback_value
+
+                if columnar:
+                    addresses[idx] = cell_address
+                    values[idx] = value
+                    rows[idx] = row
+                    cols[idx] = col
+                    if include_validation:
+                        validations[idx] = (
+                            get_data_validation_for_cell(ws, cell_address)
+                            or _NO_VALIDATION
+                        )
+                    idx += 1
+                    continue
+
+                # Build each cell dict in one literal so it is never resized
                 if include_validation:
-                    validation_info = get_data_validation_for_cell(ws, cell_address)
-                    if validation_info:
-                        cell_data["validation"] = validation_info
-                    else:
-                        cell_data["validation"] = {"has_validation": False}
+                    cell_data = {
+                        "address": cell_address,
+                        "value": value,
+                        "row": row,
+                        "column": col,
+                        "validation": (
+                            get_data_validation_for_cell(ws, cell_address)
+                            or _NO_VALIDATION
+                        ),
+                    }
+                else:
+                    cell_data = {
+                        "address": cell_address,
+                        "value": value,
+                        "row": row,
+                        "column": col
+                    }
                 
                 range_data["cells"].append(cell_data)
 
-        wb.close()
-        if wb_values is not None:
-            wb_values.close()
+        if as_numpy:
+            flat_values = (
+                values if columnar else [cell_data["value"] for cell_data in range_data["cells"]]
+            )
+            range_data["ndarray"] = _numeric_ndarray(
+                flat_values, (max(end_row - start_row + 1, 0), len(col_letters))
+            )
+
         return range_data
         
     except DataError as e:
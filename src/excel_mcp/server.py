@@ -227,7 +227,7 @@ def read_data_from_excel(
         sheet_name: Name of worksheet
         start_cell: Starting cell (default A1)
         end_cell: Ending cell (optional, auto-expands if not provided)
-        preview_only: Whether to return preview only
+        preview_only: Whether to return only the first 50 rows of the range
         evaluate_formulas: If True, compute and return formula results instead of the raw formula text
     
     Returns:  
@@ -243,7 +243,8 @@ def read_data_from_excel(
             start_cell,
             end_cell,
             include_validation=True,
-            evaluate_formulas=evaluate_formulas
+            evaluate_formulas=evaluate_formulas,
+            preview_only=preview_only
         )
         if not result or not result.get("cells"):
             return "No data found in specified range"